@@ -79,6 +79,11 @@ class HDDM_A(DriftDetector):
         self.warning_confidence = warning_confidence
         self.two_sided_test = two_sided_test
 
+        # These quantities only depend on the parameters, so they are computed once
+        self._log_inv_drift = log(1.0 / drift_confidence)
+        self._log_2_inv_drift = log(2.0 / drift_confidence)
+        self._log_2_inv_warning = log(2.0 / warning_confidence)
+
     def update(self, value) -> tuple:
         """Update the change detector with a single data point.
 
@@ -102,20 +107,20 @@ class HDDM_A(DriftDetector):
             self.n_max = self.total_n
             self.c_max = self.total_c
 
-        cota = sqrt(1.0 / (2 * self.n_min) * log(1.0 / self.drift_confidence))
-        cota1 = sqrt(1.0 / (2 * self.total_n) * log(1.0 / self.drift_confidence))
+        cota = sqrt(1.0 / (2 * self.n_min) * self._log_inv_drift)
+        cota1 = sqrt(1.0 / (2 * self.total_n) * self._log_inv_drift)
 
         if self.c_min / self.n_min + cota >= self.total_c / self.total_n + cota1:
             self.c_min = self.total_c
             self.n_min = self.total_n
 
-        cota = sqrt(1.0 / (2 * self.n_max) * log(1.0 / self.drift_confidence))
+        cota = sqrt(1.0 / (2 * self.n_max) * self._log_inv_drift)
         if self.c_max / self.n_max - cota <= self.total_c / self.total_n - cota1:
             self.c_max = self.total_c
             self.n_max = self.total_n
 
         if self._mean_incr(
-            self.c_min, self.n_min, self.total_c, self.total_n, self.drift_confidence
+            self.c_min, self.n_min, self.total_c, self.total_n, self._log_2_inv_drift
         ):
             self.n_estimation = self.total_n - self.n_min
             self.c_estimation = self.total_c - self.c_min
@@ -124,7 +129,7 @@ class HDDM_A(DriftDetector):
             self._in_concept_change = True
             self._in_warning_zone = False
         elif self._mean_incr(
-            self.c_min, self.n_min, self.total_c, self.total_n, self.warning_confidence
+            self.c_min, self.n_min, self.total_c, self.total_n, self._log_2_inv_warning
         ):
             self._in_concept_change = False
             self._in_warning_zone = True
@@ -138,7 +143,7 @@ class HDDM_A(DriftDetector):
                 self.n_max,
                 self.total_c,
                 self.total_n,
-                self.drift_confidence,
+                self._log_2_inv_drift,
             ):
                 self.n_estimation = self.total_n - self.n_max
                 self.c_estimation = self.total_c - self.c_max
@@ -150,7 +155,7 @@ class HDDM_A(DriftDetector):
                 self.n_max,
                 self.total_c,
                 self.total_n,
-                self.warning_confidence,
+                self._log_2_inv_warning,
             ):
                 self._in_warning_zone = True
 
@@ -159,20 +164,20 @@ class HDDM_A(DriftDetector):
         return self._in_concept_change, self._in_warning_zone
 
     @staticmethod
-    def _mean_incr(c_min, n_min, total_c, total_n, confidence):
+    def _mean_incr(c_min, n_min, total_c, total_n, log_2_inv_confidence):
         if n_min == total_n:
             return False
 
         m = (total_n - n_min) / n_min * (1.0 / total_n)
-        cota = sqrt(m / 2 * log(2.0 / confidence))
+        cota = sqrt(m / 2 * log_2_inv_confidence)
         return total_c / total_n - c_min / n_min >= cota
 
-    def _mean_decr(self, c_max, n_max, total_c, total_n, confidence):
+    def _mean_decr(self, c_max, n_max, total_c, total_n, log_2_inv_confidence):
         if n_max == total_n:
             return False
 
         m = (total_n - n_max) / n_max * (1.0 / total_n)
-        cota = sqrt(m / 2 * log(2.0 / confidence))
+        cota = sqrt(m / 2 * log_2_inv_confidence)
         return c_max / n_max - total_c / total_n >= cota
 
     def reset(self):
@@ -62,7 +62,12 @@ class HDDM_W(DriftDetector):
     """
 
     class SampleInfo:
+        __slots__ = ["EWMA_estimator", "independent_bounded_condition_sum"]
+
         def __init__(self):
+            self.reset()
+
+        def reset(self):
             self.EWMA_estimator = -1.0
             self.independent_bounded_condition_sum = 0.0
 
@@ -74,22 +79,25 @@ class HDDM_W(DriftDetector):
         two_sided_test=False,
     ):
         super().__init__()
-        super().reset()
         self.total = self.SampleInfo()
         self.sample1_decr_monitor = self.SampleInfo()
         self.sample1_incr_monitor = self.SampleInfo()
         self.sample2_decr_monitor = self.SampleInfo()
         self.sample2_incr_monitor = self.SampleInfo()
-        self.incr_cutpoint = float("inf")
-        self.decr_cutpoint = float("inf")
-        self.width = 0
-        self.delay = 0
+        self.reset()
         self.drift_confidence = drift_confidence
         self.warning_confidence = warning_confidence
         self.lambda_option = lambda_option
         self.two_sided_test = two_sided_test
         self.estimation = None
 
+        # These quantities only depend on the parameters, so they are computed once
+        self._aux_decay = 1.0 - lambda_option
+        self._lambda_sq = lambda_option * lambda_option
+        self._aux_decay_sq = self._aux_decay * self._aux_decay
+        self._half_log_inv_drift = log(1.0 / drift_confidence) / 2
+        self._half_log_inv_warning = log(1.0 / warning_confidence) / 2
+
     def update(self, value):
         """Update the change detector with a single data point.
 
@@ -106,40 +114,38 @@ class HDDM_W(DriftDetector):
             detected.
 
         """
-        aux_decay_rate = 1.0 - self.lambda_option
         self.width += 1
-        if self.total.EWMA_estimator < 0:
-            self.total.EWMA_estimator = value
-            self.total.independent_bounded_condition_sum = 1
+        total = self.total
+        if total.EWMA_estimator < 0:
+            total.EWMA_estimator = value
+            total.independent_bounded_condition_sum = 1
         else:
-            self.total.EWMA_estimator = (
-                self.lambda_option * value + aux_decay_rate * self.total.EWMA_estimator
+            total.EWMA_estimator = (
+                self.lambda_option * value + self._aux_decay * total.EWMA_estimator
             )
-            self.total.independent_bounded_condition_sum = (
-                self.lambda_option * self.lambda_option
-                + aux_decay_rate
-                * aux_decay_rate
-                * self.total.independent_bounded_condition_sum
+            total.independent_bounded_condition_sum = (
+                self._lambda_sq
+                + self._aux_decay_sq * total.independent_bounded_condition_sum
             )
 
-        self._update_incr_statistics(value, self.drift_confidence)
-        if self._monitor_mean_incr(self.drift_confidence):
+        self._update_incr_statistics(value, self._half_log_inv_drift)
+        if self._monitor_mean_incr(self._half_log_inv_drift):
             self.reset()
             self._in_concept_change = True
             self._in_warning_zone = False
-        elif self._monitor_mean_incr(self.warning_confidence):
+        elif self._monitor_mean_incr(self._half_log_inv_warning):
             self._in_concept_change = False
             self._in_warning_zone = True
         else:
             self._in_concept_change = False
             self._in_warning_zone = False
 
-        self._update_decr_statistics(value, self.drift_confidence)
+        self._update_decr_statistics(value, self._half_log_inv_drift)
         if self.two_sided_test:
-            if self._monitor_mean_decr(self.drift_confidence):
+            if self._monitor_mean_decr(self._half_log_inv_drift):
                 self.reset()
                 self._in_concept_change = True
-            elif self._monitor_mean_decr(self.warning_confidence):
+            elif self._monitor_mean_decr(self._half_log_inv_warning):
                 self._in_warning_zone = True
 
         self.estimation = self.total.EWMA_estimator
@@ -147,94 +153,101 @@ class HDDM_W(DriftDetector):
         return self._in_concept_change, self._in_warning_zone
 
     @staticmethod
-    def _detect_mean_increment(sample1, sample2, confidence):
+    def _detect_mean_increment(sample1, sample2, half_log_inv_confidence):
         if sample1.EWMA_estimator < 0 or sample2.EWMA_estimator < 0:
             return False
+        diff = sample2.EWMA_estimator - sample1.EWMA_estimator
+        # The bound is non-negative, so there is no need to compute it if the mean didn't increase
+        if diff <= 0:
+            return False
         ibc_sum = (
             sample1.independent_bounded_condition_sum
             + sample2.independent_bounded_condition_sum
         )
-        bound = sqrt(ibc_sum * log(1 / confidence) / 2)
-        return sample2.EWMA_estimator - sample1.EWMA_estimator > bound
+        # Both sides are non-negative, hence they are squared to avoid computing a square root
+        return diff * diff > ibc_sum * half_log_inv_confidence
 
-    def _monitor_mean_incr(self, confidence):
+    def _monitor_mean_incr(self, half_log_inv_confidence):
         return self._detect_mean_increment(
-            self.sample1_incr_monitor, self.sample2_incr_monitor, confidence
+            self.sample1_incr_monitor,
+            self.sample2_incr_monitor,
+            half_log_inv_confidence,
         )
 
-    def _monitor_mean_decr(self, confidence):
+    def _monitor_mean_decr(self, half_log_inv_confidence):
         return self._detect_mean_increment(
-            self.sample2_decr_monitor, self.sample1_decr_monitor, confidence
+            self.sample2_decr_monitor,
+            self.sample1_decr_monitor,
+            half_log_inv_confidence,
         )
 
-    def _update_incr_statistics(self, value, confidence):
-        aux_decay = 1.0 - self.lambda_option
-        bound = sqrt(
-            self.total.independent_bounded_condition_sum * log(1.0 / confidence) / 2
-        )
+    def _update_incr_statistics(self, value, half_log_inv_confidence):
+        total = self.total
+        bound = sqrt(total.independent_bounded_condition_sum * half_log_inv_confidence)
 
-        if self.total.EWMA_estimator + bound < self.incr_cutpoint:
-            self.incr_cutpoint = self.total.EWMA_estimator + bound
-            self.sample1_incr_monitor.EWMA_estimator = self.total.EWMA_estimator
-            self.sample1_incr_monitor.independent_bounded_condition_sum = (
-                self.total.independent_bounded_condition_sum
+        if total.EWMA_estimator + bound < self.incr_cutpoint:
+            self.incr_cutpoint = total.EWMA_estimator + bound
+            sample1 = self.sample1_incr_monitor
+            sample1.EWMA_estimator = total.EWMA_estimator
+            sample1.independent_bounded_condition_sum = (
+                total.independent_bounded_condition_sum
             )
-            self.sample2_incr_monitor = self.SampleInfo()
+            self.sample2_incr_monitor.reset()
             self.delay = 0
         else:
             self.delay += 1
-            if self.sample2_incr_monitor.EWMA_estimator < 0:
-                self.sample2_incr_monitor.EWMA_estimator = value
-                self.sample2_incr_monitor.independent_bounded_condition_sum = 1
+            sample2 = self.sample2_incr_monitor
+            if sample2.EWMA_estimator < 0:
+                sample2.EWMA_estimator = value
+                sample2.independent_bounded_condition_sum = 1
             else:
-                self.sample2_incr_monitor.EWMA_estimator = (
+                sample2.EWMA_estimator = (
                     self.lambda_option * value
-                    + aux_decay * self.sample2_incr_monitor.EWMA_estimator
+                    + self._aux_decay * sample2.EWMA_estimator
                 )
-                self.sample2_incr_monitor.independent_bounded_condition_sum = (
-                    self.lambda_option * self.lambda_option
-                    + aux_decay
-                    * aux_decay
-                    * self.sample2_incr_monitor.independent_bounded_condition_sum
+                sample2.independent_bounded_condition_sum = (
+                    self._lambda_sq
+                    + self._aux_decay_sq * sample2.independent_bounded_condition_sum
                 )
 
-    def _update_decr_statistics(self, value, confidence):
-        aux_decay = 1.0 - self.lambda_option
+    def _update_decr_statistics(self, value, half_log_inv_confidence):
+        total = self.total
         epsilon = sqrt(
-            self.total.independent_bounded_condition_sum * log(1.0 / confidence) / 2
+            total.independent_bounded_condition_sum * half_log_inv_confidence
         )
 
-        if self.total.EWMA_estimator - epsilon > self.decr_cutpoint:
-            self.decr_cutpoint = self.total.EWMA_estimator - epsilon
-            self.sample1_decr_monitor.EWMA_estimator = self.total.EWMA_estimator
-            self.sample1_decr_monitor.independent_bounded_condition_sum = (
-                self.total.independent_bounded_condition_sum
+        if total.EWMA_estimator - epsilon > self.decr_cutpoint:
+            self.decr_cutpoint = total.EWMA_estimator - epsilon
+            sample1 = self.sample1_decr_monitor
+            sample1.EWMA_estimator = total.EWMA_estimator
+            sample1.independent_bounded_condition_sum = (
+                total.independent_bounded_condition_sum
             )
-            self.sample2_decr_monitor = self.SampleInfo()
+            self.sample2_decr_monitor.reset()
         else:
-            if self.sample2_decr_monitor.EWMA_estimator < 0:
-                self.sample2_decr_monitor.EWMA_estimator = value
-                self.sample2_decr_monitor.independent_bounded_condition_sum = 1
+            sample2 = self.sample2_decr_monitor
+            if sample2.EWMA_estimator < 0:
+                sample2.EWMA_estimator = value
+                sample2.independent_bounded_condition_sum = 1
             else:
-                self.sample2_decr_monitor.EWMA_estimator = (
+                sample2.EWMA_estimator = (
                     self.lambda_option * value
-                    + aux_decay * self.sample2_decr_monitor.EWMA_estimator
+                    + self._aux_decay * sample2.EWMA_estimator
                 )
-                self.sample2_decr_monitor.independent_bounded_condition_sum = (
-                    self.lambda_option * self.lambda_option
-                    + aux_decay
-                    * aux_decay
-                    * self.sample2_decr_monitor.independent_bounded_condition_sum
+                sample2.independent_bounded_condition_sum = (
+                    self._lambda_sq
+                    + self._aux_decay_sq * sample2.independent_bounded_condition_sum
                 )
 
     def reset(self):
         """Reset the change detector."""
         super().reset()
-        self.total = self.SampleInfo()
-        self.sample1_decr_monitor = self.SampleInfo()
-        self.sample1_incr_monitor = self.SampleInfo()
-        self.sample2_decr_monitor = self.SampleInfo()
-        self.sample2_incr_monitor = self.SampleInfo()
+        # The statistics are reset in place, given that this happens each time a drift is detected
+        self.total.reset()
+        self.sample1_decr_monitor.reset()
+        self.sample1_incr_monitor.reset()
+        self.sample2_decr_monitor.reset()
+        self.sample2_incr_monitor.reset()
         self.incr_cutpoint = float("inf")
         self.decr_cutpoint = float("inf")
         self.width = 0
@@ -1,5 +1,6 @@
 import collections
 import copy
+import pickle
 
 from river import base, linear_model
 from river.utils.math import prod
@@ -12,23 +13,53 @@ __all__ = [
     "MonteCarloClassifierChain",
 ]
 
+# Marks the features which were not present in x before a chain added its predictions to it
+_MISSING = object()
+
+
+def _restore(x, original):
+    """Undo the modifications made to x by a chain's predictions."""
+    for key, value in original.items():
+        if value is _MISSING:
+            del x[key]
+        else:
+            x[key] = value
+
 
 class BaseChain(base.WrapperMixin, collections.UserDict):
     def __init__(self, model, order: list = None):
         super().__init__()
         self.model = model
         self.order = order or []
+        self._model_bytes = None
 
     @property
     def _wrapped_model(self):
         return self.model
 
+    def _clone_model(self):
+        # Unpickling a serialized copy of the prototype is a lot cheaper than deep-copying it for
+        # every output. Models which can't be pickled, for instance because they contain a lambda
+        # function, are deep-copied instead.
+        if self._model_bytes is None:
+            try:
+                self._model_bytes = pickle.dumps(
+                    self.model, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            except (pickle.PicklingError, AttributeError, TypeError):
+                self._model_bytes = b""
+        if self._model_bytes:
+            return pickle.loads(self._model_bytes)
+        return copy.deepcopy(self.model)
+
     def __getitem__(self, key):
+        # The underlying dict is accessed directly because this is called for each output on every
+        # learn and predict call
         try:
-            return collections.UserDict.__getitem__(self, key)
+            return self.data[key]
         except KeyError:
-            collections.UserDict.__setitem__(self, key, copy.deepcopy(self.model))
-            return self[key]
+            model = self.data[key] = self._clone_model()
+            return model
 
 
 class ClassifierChain(BaseChain, base.Classifier, base.MultiOutputMixin):
@@ -102,8 +133,9 @@ class ClassifierChain(BaseChain, base.Classifier, base.MultiOutputMixin):
 
     def learn_one(self, x, y):
 
-        x = copy.copy(x)
+        x = x.copy()
         n_seen = 0
+        multiclass = self._multiclass
 
         for o in self.order:
             clf = self[o]
@@ -120,7 +152,7 @@ class ClassifierChain(BaseChain, base.Classifier, base.MultiOutputMixin):
                 pass
 
             # The predictions are stored as features for the next label
-            if clf._multiclass:
+            if multiclass:
                 for label, proba in y_pred.items():
                     x[f"{o}_{label}"] = proba
             else:
@@ -137,20 +169,32 @@ class ClassifierChain(BaseChain, base.Classifier, base.MultiOutputMixin):
 
     def predict_proba_one(self, x):
 
-        x = copy.copy(x)
         y_pred = {}
+        multiclass = self._multiclass
 
-        for o in self.order:
-            clf = self[o]
-
-            y_pred[o] = clf.predict_proba_one(x)
+        # The predictions are added to x in place instead of working on a copy of x. The original
+        # values of the keys which are set are kept aside in order to restore x before returning.
+        original = {}
 
-            # The predictions are stored as features for the next label
-            if clf._multiclass:
-                for label, proba in y_pred.items():
-                    x[f"{o}_{label}"] = proba
-            else:
-                x[o] = y_pred[o][True]
+        try:
+            for o in self.order:
+                clf = self[o]
+
+                y_pred[o] = y_pred_o = clf.predict_proba_one(x)
+
+                # The predictions are stored as features for the next label
+                if multiclass:
+                    for label, proba in y_pred_o.items():
+                        key = f"{o}_{label}"
+                        if key not in original:
+                            original[key] = x.get(key, _MISSING)
+                        x[key] = proba
+                else:
+                    if o not in original:
+                        original[o] = x.get(o, _MISSING)
+                    x[o] = y_pred_o[True]
+        finally:
+            _restore(x, original)
 
         return y_pred
 
@@ -215,7 +259,7 @@ class RegressorChain(BaseChain, base.Regressor, base.MultiOutputMixin):
 
     def learn_one(self, x, y):
 
-        x = copy.copy(x)
+        x = x.copy()
         n_seen = 0
 
         for o in self.order:
@@ -246,15 +290,23 @@ class RegressorChain(BaseChain, base.Regressor, base.MultiOutputMixin):
 
     def predict_one(self, x):
 
-        x = copy.copy(x)
         y_pred = {}
 
         if not isinstance(self.order, list):
             return y_pred
 
-        for o, clf in self.items():
-            y_pred[o] = clf.predict_one(x)
-            x[o] = y_pred[o]
+        # The predictions are added to x in place instead of working on a copy of x. The original
+        # values of the keys which are set are kept aside in order to restore x before returning.
+        original = {}
+
+        try:
+            for o, clf in self.items():
+                y_pred[o] = clf.predict_one(x)
+                if o not in original:
+                    original[o] = x.get(o, _MISSING)
+                x[o] = y_pred[o]
+        finally:
+            _restore(x, original)
 
         return y_pred
 
@@ -334,7 +386,7 @@ class ProbabilisticClassifierChain(ClassifierChain):
             payoff = self._payoff(x=x, y=y_gen)
             # if it performs well, keep it, and record the max
             if payoff > max_payoff:
-                y_pred = copy.copy(y_gen)
+                y_pred = y_gen.copy()
                 max_payoff = payoff
         return y_pred
 
@@ -342,7 +394,7 @@ class ProbabilisticClassifierChain(ClassifierChain):
         # Calculate payoff for predicting y | x, under the chains model.
         p = {}
 
-        x = copy.copy(x)
+        x = x.copy()
 
         for label in self.order:
             clf = self[label]
@@ -418,7 +470,7 @@ class MonteCarloClassifierChain(ProbabilisticClassifierChain):
         # Sample y ~ P(y|x)
         p = {}
         y = {}
-        x = copy.copy(x)
+        x = x.copy()
 
         for label in self.order:
             clf = self[label]
@@ -448,6 +500,6 @@ class MonteCarloClassifierChain(ProbabilisticClassifierChain):
             payoff = self._payoff(x=x, y=y_)
             # if it performs well, keep it, and record the max
             if payoff > max_payoff:
-                y_pred = copy.copy(y_)
+                y_pred = y_.copy()
                 max_payoff = payoff
         return y_pred
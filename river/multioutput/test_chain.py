@@ -0,0 +1,42 @@
+from river import linear_model, multioutput, synth, tree
+
+
+def test_classifier_chain_multiclass_features():
+    """The class probabilities of a multi-class model should be fed to the next model."""
+
+    model = multioutput.ClassifierChain(model=tree.HoeffdingTreeClassifier())
+    for x, y in synth.Logical(seed=42, n_tiles=20):
+        model.learn_one(x, y)
+
+    y_pred = model.predict_proba_one(x)
+
+    x = dict(x)
+    for o in model.order:
+        y_pred_o = model[o].predict_proba_one(x)
+        assert y_pred[o] == y_pred_o
+        for label, proba in y_pred_o.items():
+            x[f"{o}_{label}"] = proba
+
+
+def test_chains_do_not_modify_features():
+    """The predictions are added to x in place, but x should be restored afterwards."""
+
+    dataset = list(synth.Logical(seed=42, n_tiles=20))
+
+    regressor = multioutput.RegressorChain(
+        model=linear_model.LinearRegression(), order=["OR", "XOR", "AND"]
+    )
+    classifier = multioutput.ClassifierChain(model=linear_model.LogisticRegression())
+    for x, y in dataset:
+        regressor.learn_one(x, {o: float(v) for o, v in y.items()})
+        classifier.learn_one(x, y)
+
+    x = {"A": 1, "XOR": 42}
+    regressor.predict_one(x)
+    assert x == {"A": 1, "XOR": 42}
+    assert list(x) == ["A", "XOR"]
+
+    x = {"A": 1, "XOR": 42}
+    classifier.predict_proba_one(x)
+    assert x == {"A": 1, "XOR": 42}
+    assert list(x) == ["A", "XOR"]
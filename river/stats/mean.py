@@ -69,7 +69,7 @@ class Mean(base.Univariate):
         return self
 
     def __add__(self, other):
-        result = copy.deepcopy(self)
+        result = copy.copy(self)
         result += other
 
         return result
@@ -87,7 +87,7 @@ class Mean(base.Univariate):
         return self
 
     def __sub__(self, other):
-        result = copy.deepcopy(self)
+        result = copy.copy(self)
         result -= other
 
         return result
@@ -176,3 +176,30 @@ def test_rolling_bivariate(stat, func):
             x_tail = tail(X[: i + 1], n)
             y_tail = tail(Y[: i + 1], n)
             assert math.isclose(stat.get(), func(x_tail, y_tail), abs_tol=1e-10)
+
+
+@pytest.mark.parametrize(
+    "stat, func",
+    [
+        (stats.Mean(), statistics.mean),
+        (stats.Var(), functools.partial(np.var, ddof=1)),
+    ],
+)
+def test_add_sub(stat, func):
+
+    X = [random.random() for _ in range(30)]
+    left = copy.deepcopy(stat)
+    right = copy.deepcopy(stat)
+    for x in X[:20]:
+        left.update(x)
+    for x in X[20:]:
+        right.update(x)
+    before = left.get()
+
+    total = left + right
+    assert math.isclose(total.get(), func(X), abs_tol=1e-10)
+    assert math.isclose((total - right).get(), func(X[:20]), abs_tol=1e-10)
+
+    # The operands are left untouched
+    assert left.get() == before
+    assert math.isclose(right.get(), func(X[20:]), abs_tol=1e-10)
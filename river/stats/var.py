@@ -54,13 +54,14 @@ class Var(base.Univariate):
         self.sigma = 0.0
 
     def update(self, x, w=1.0):
-        mean = self.mean.get()
-        self.mean.update(x, w)
-        if self.mean.n > self.ddof:
+        mean = self.mean
+        old_mean = mean.mean
+        mean.update(x, w)
+        if mean.n > self.ddof:
             self.sigma += (
                 w
-                * ((x - mean) * (x - self.mean.get()) - self.sigma)
-                / (self.mean.n - self.ddof)
+                * ((x - old_mean) * (x - mean.mean) - self.sigma)
+                / (mean.n - self.ddof)
             )
         return self
 
@@ -87,7 +88,8 @@ class Var(base.Univariate):
         return self
 
     def __add__(self, other):
-        result = copy.deepcopy(self)
+        result = copy.copy(self)
+        result.mean = copy.copy(self.mean)
         result += other
 
         return result
@@ -115,7 +117,8 @@ class Var(base.Univariate):
         return self
 
     def __sub__(self, other):
-        result = copy.deepcopy(self)
+        result = copy.copy(self)
+        result.mean = copy.copy(self.mean)
         result -= other
 
         return result
@@ -1,5 +1,4 @@
 """General tests that all estimators need to pass."""
-import copy
 import importlib
 import inspect
 
@@ -141,4 +140,4 @@ def get_all_estimators():
     ],
 )
 def test_check_estimator(estimator, check):
-    check(copy.deepcopy(estimator))
+    check(estimator.clone())
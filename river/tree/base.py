@@ -45,20 +45,28 @@ class Branch(Base, abc.ABC):
 
     def walk(self, x, until_leaf=True) -> Iterable[Union["Branch", "Leaf"]]:
         """Iterate over the nodes of the path induced by x."""
-        yield self
-        try:
-            yield from self.next(x).walk(x, until_leaf)
-        except KeyError:
-            if until_leaf:
-                _, node = self.most_common_path()
-                yield node
-                yield from node.walk(x, until_leaf)
+        node = self
+        while isinstance(node, Branch):
+            yield node
+            try:
+                node = node.next(x)
+            except KeyError:
+                if not until_leaf:
+                    return
+                _, node = node.most_common_path()
+        yield node
 
     def traverse(self, x, until_leaf=True) -> "Leaf":
         """Return the leaf corresponding to the given input."""
-        for node in self.walk(x, until_leaf):
-            pass
-        return node  # noqa
+        node = self
+        while isinstance(node, Branch):
+            try:
+                node = node.next(x)
+            except KeyError:
+                if not until_leaf:
+                    break
+                _, node = node.most_common_path()
+        return node
 
     @property
     def n_nodes(self):
@@ -205,7 +205,9 @@ class ExtremelyFastDecisionTreeClassifier(HoeffdingTreeClassifier):
         self
         """
         # Updates the set of observed classes
-        self.classes.add(y)
+        if y not in self.classes:
+            self.classes.add(y)
+            self._zero_proba = dict.fromkeys(self.classes, 0.0)
 
         self._train_weight_seen_by_model += sample_weight
 
@@ -262,7 +264,9 @@ class ExtremelyFastDecisionTreeClassifier(HoeffdingTreeClassifier):
                         break
         node.learn_one(x, y, sample_weight=sample_weight, tree=self)
 
-        if self._train_weight_seen_by_model % self.memory_estimate_period == 0:
+        self._mem_check_countdown -= sample_weight
+        if self._mem_check_countdown <= 0:
+            self._mem_check_countdown = self.memory_estimate_period
             self._estimate_model_size()
 
     def _process_nodes(self, x, y, sample_weight, node, parent, branch_index):
@@ -1,7 +1,5 @@
 import typing
 
-from river.utils.skmultiflow_utils import add_dict_values, normalize_values_in_dict
-
 from .hoeffding_tree_classifier import HoeffdingTreeClassifier
 from .nodes.branch import DTBranch
 from .nodes.hatc_nodes import (
@@ -171,6 +169,8 @@ class HoeffdingAdaptiveTreeClassifier(HoeffdingTreeClassifier):
         self._n_alternate_trees = 0
         self._n_pruned_alternate_trees = 0
         self._n_switch_alternate_trees = 0
+        # Whether alternate subtrees hang from the tree; if not, predictions follow a single path
+        self._has_alternate_trees = False
 
         self.bootstrap_sampling = bootstrap_sampling
         self.drift_window_threshold = drift_window_threshold
@@ -203,7 +203,9 @@ class HoeffdingAdaptiveTreeClassifier(HoeffdingTreeClassifier):
 
     def learn_one(self, x, y, *, sample_weight=1.0):
         # Updates the set of observed classes
-        self.classes.add(y)
+        if y not in self.classes:
+            self.classes.add(y)
+            self._zero_proba = dict.fromkeys(self.classes, 0.0)
 
         self._train_weight_seen_by_model += sample_weight
 
@@ -211,29 +213,65 @@ class HoeffdingAdaptiveTreeClassifier(HoeffdingTreeClassifier):
             self._root = self._new_leaf()
             self._n_active_leaves = 1
 
+        structure = self._structure_signature()
         self._root.learn_one(x, y, sample_weight=sample_weight, tree=self)
-
-        if self._train_weight_seen_by_model % self.memory_estimate_period == 0:
+        if self._structure_signature() != structure:
+            self._has_alternate_trees = isinstance(self._root, DTBranch) and any(
+                branch._alternate_tree is not None
+                for branch in self._root.iter_branches()
+            )
+
+        self._mem_check_countdown -= sample_weight
+        if self._mem_check_countdown <= 0:
+            self._mem_check_countdown = self.memory_estimate_period
             self._estimate_model_size()
 
         return self
 
     # Override HoeffdingTreeClassifier
     def predict_proba_one(self, x):
-        proba = {c: 0.0 for c in self.classes}
+        proba = self._zero_proba.copy()
         if self._root is not None:
             found_nodes = [self._root]
             if isinstance(self._root, DTBranch):
-                found_nodes = self._root.traverse(x, until_leaf=True)
+                if self._has_alternate_trees:
+                    found_nodes = self._root.traverse(x, until_leaf=True)
+                else:
+                    found_nodes = [DTBranch.traverse(self._root, x, until_leaf=True)]
             for leaf in found_nodes:
                 dist = leaf.prediction(x, tree=self)
                 # Option Tree prediction (of sorts): combine the response of all leaves reached
-                # by the instance
-                proba = add_dict_values(proba, dist, inplace=True)
-            proba = normalize_values_in_dict(proba)
+                # by the instance. Every class predicted by a leaf was seen by the tree, hence it
+                # is already in proba.
+                for c, p in dist.items():
+                    proba[c] += p
+
+            total = sum(proba.values())
+            # A null (or NaN) total means there is nothing to normalize
+            if total > 0:
+                factor = 1 / total
+                for c in proba:
+                    proba[c] *= factor
 
         return proba
 
+    def _structure_signature(self):
+        """Summary of the tree structure that changes whenever alternate trees might appear
+        or vanish.
+
+        Besides being created, pruned, or switched, an alternate subtree is lost when an
+        alternate leaf splits: the new branch replaces the node that held it, or the root. Such
+        splits change the number of leaves.
+        """
+        return (
+            self._root,
+            self._n_alternate_trees,
+            self._n_pruned_alternate_trees,
+            self._n_switch_alternate_trees,
+            self._n_active_leaves,
+            self._n_inactive_leaves,
+        )
+
     def _new_leaf(self, initial_stats=None, parent=None):
         if initial_stats is None:
             initial_stats = {}
@@ -244,11 +282,7 @@ class HoeffdingAdaptiveTreeClassifier(HoeffdingTreeClassifier):
             depth = 0
 
         return AdaLeafClassifier(
-            stats=initial_stats,
-            depth=depth,
-            splitter=self.splitter,
-            adwin_delta=self.adwin_confidence,
-            seed=self.seed,
+            initial_stats, depth, self.splitter, self.adwin_confidence, self.seed
         )
 
     def _branch_selector(
@@ -189,6 +189,8 @@ class HoeffdingAdaptiveTreeRegressor(HoeffdingTreeRegressor):
         self._n_alternate_trees = 0
         self._n_pruned_alternate_trees = 0
         self._n_switch_alternate_trees = 0
+        # Whether alternate subtrees hang from the tree; if not, predictions follow a single path
+        self._has_alternate_trees = False
 
         self.bootstrap_sampling = bootstrap_sampling
         self.drift_window_threshold = drift_window_threshold
@@ -225,9 +227,17 @@ class HoeffdingAdaptiveTreeRegressor(HoeffdingTreeRegressor):
         if self._root is None:
             self._root = self._new_leaf()
             self._n_active_leaves = 1
+        structure = self._structure_signature()
         self._root.learn_one(x, y, sample_weight=sample_weight, tree=self)
+        if self._structure_signature() != structure:
+            self._has_alternate_trees = isinstance(self._root, DTBranch) and any(
+                branch._alternate_tree is not None
+                for branch in self._root.iter_branches()
+            )
 
-        if self._train_weight_seen_by_model % self.memory_estimate_period == 0:
+        self._mem_check_countdown -= sample_weight
+        if self._mem_check_countdown <= 0:
+            self._mem_check_countdown = self.memory_estimate_period
             self._estimate_model_size()
 
         return self
@@ -237,7 +247,10 @@ class HoeffdingAdaptiveTreeRegressor(HoeffdingTreeRegressor):
         if self._root is not None:
             found_nodes = [self._root]
             if isinstance(self._root, DTBranch):
-                found_nodes = self._root.traverse(x, until_leaf=True)
+                if self._has_alternate_trees:
+                    found_nodes = self._root.traverse(x, until_leaf=True)
+                else:
+                    found_nodes = [DTBranch.traverse(self._root, x, until_leaf=True)]
             for leaf in found_nodes:
                 pred += leaf.prediction(x, tree=self)
             # Mean prediction among the reached leaves
@@ -245,6 +258,23 @@ class HoeffdingAdaptiveTreeRegressor(HoeffdingTreeRegressor):
 
         return pred
 
+    def _structure_signature(self):
+        """Summary of the tree structure that changes whenever alternate trees might appear
+        or vanish.
+
+        Besides being created, pruned, or switched, an alternate subtree is lost when an
+        alternate leaf splits: the new branch replaces the node that held it, or the root. Such
+        splits change the number of leaves.
+        """
+        return (
+            self._root,
+            self._n_alternate_trees,
+            self._n_pruned_alternate_trees,
+            self._n_switch_alternate_trees,
+            self._n_active_leaves,
+            self._n_inactive_leaves,
+        )
+
     def _new_leaf(self, initial_stats=None, parent=None, is_active=True):
         """Create a new learning node.
 
@@ -267,19 +297,15 @@ class HoeffdingAdaptiveTreeRegressor(HoeffdingTreeRegressor):
 
         if self.leaf_prediction == self._TARGET_MEAN:
             return AdaLeafRegMean(
-                initial_stats,
-                depth,
-                self.splitter,
-                adwin_delta=self.adwin_confidence,
-                seed=self.seed,
+                initial_stats, depth, self.splitter, self.adwin_confidence, self.seed
             )
         elif self.leaf_prediction == self._MODEL:
             return AdaLeafRegModel(
                 initial_stats,
                 depth,
                 self.splitter,
-                adwin_delta=self.adwin_confidence,
-                seed=self.seed,
+                self.adwin_confidence,
+                self.seed,
                 leaf_model=leaf_model,
             )
         else:  # adaptive learning node
@@ -287,8 +313,8 @@ class HoeffdingAdaptiveTreeRegressor(HoeffdingTreeRegressor):
                 initial_stats,
                 depth,
                 self.splitter,
-                adwin_delta=self.adwin_confidence,
-                seed=self.seed,
+                self.adwin_confidence,
+                self.seed,
                 leaf_model=leaf_model,
             )
             if parent is not None and isinstance(parent, AdaLeafRegressor):
@@ -85,6 +85,8 @@ class HoeffdingTree(ABC):
         self._size_estimate_overhead_fraction: float = 1.0
         self._growth_allowed = True
         self._train_weight_seen_by_model: float = 0.0
+        # Training weight left before the next memory consumption check
+        self._mem_check_countdown: float = memory_estimate_period
 
     @staticmethod
     def _hoeffding_bound(range_val, confidence, n):
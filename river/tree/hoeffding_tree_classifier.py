@@ -164,6 +164,8 @@ class HoeffdingTreeClassifier(HoeffdingTree, base.Classifier):
 
         # To keep track of the observed classes
         self.classes: set = set()
+        # Null probabilities of the observed classes, copied to start each prediction
+        self._zero_proba: dict = {}
 
     @HoeffdingTree.split_criterion.setter
     def split_criterion(self, split_criterion):
@@ -336,7 +338,9 @@ class HoeffdingTreeClassifier(HoeffdingTree, base.Classifier):
         """
 
         # Updates the set of observed classes
-        self.classes.add(y)
+        if y not in self.classes:
+            self.classes.add(y)
+            self._zero_proba = dict.fromkeys(self.classes, 0.0)
 
         self._train_weight_seen_by_model += sample_weight
 
@@ -398,13 +402,15 @@ class HoeffdingTreeClassifier(HoeffdingTree, base.Classifier):
             # Learn from the sample
             node.learn_one(x, y, sample_weight=sample_weight, tree=self)
 
-        if self._train_weight_seen_by_model % self.memory_estimate_period == 0:
+        self._mem_check_countdown -= sample_weight
+        if self._mem_check_countdown <= 0:
+            self._mem_check_countdown = self.memory_estimate_period
             self._estimate_model_size()
 
         return self
 
     def predict_proba_one(self, x):
-        proba = {c: 0.0 for c in self.classes}
+        proba = self._zero_proba.copy()
         if self._root is not None:
             if isinstance(self._root, DTBranch):
                 leaf = self._root.traverse(x, until_leaf=True)
@@ -235,18 +235,14 @@ class HoeffdingTreeRegressor(HoeffdingTree, base.Regressor):
             self._root = self._new_leaf()
             self._n_active_leaves = 1
 
+        # Descend until a leaf is found or a branch cannot route the instance
         p_node = None
-        node = None
-        if isinstance(self._root, DTBranch):
-            path = iter(self._root.walk(x, until_leaf=False))
-            while True:
-                aux = next(path, None)
-                if aux is None:
-                    break
-                p_node = node
-                node = aux
-        else:
-            node = self._root
+        node = self._root
+        while isinstance(node, DTBranch):
+            try:
+                p_node, node = node, node.next(x)
+            except KeyError:
+                break
 
         if isinstance(node, HTLeaf):
             node.learn_one(x, y, sample_weight=sample_weight, tree=self)
@@ -289,7 +285,9 @@ class HoeffdingTreeRegressor(HoeffdingTree, base.Regressor):
             # Learn from the sample
             node.learn_one(x, y, sample_weight=sample_weight, tree=self)
 
-        if self._train_weight_seen_by_model % self.memory_estimate_period == 0:
+        self._mem_check_countdown -= sample_weight
+        if self._mem_check_countdown <= 0:
+            self._mem_check_countdown = self.memory_estimate_period
             self._estimate_model_size()
 
         return self
@@ -348,6 +346,11 @@ class HoeffdingTreeRegressor(HoeffdingTree, base.Regressor):
 
         """
         split_criterion = self._new_split_criterion()
+        # No split can reduce the variance of a constant target, so there is no need to
+        # evaluate the candidates
+        if split_criterion.compute_var(leaf.stats) <= 0.0:
+            return
+
         best_split_suggestions = leaf.best_split_suggestions(split_criterion, self)
         best_split_suggestions.sort()
         should_split = False
@@ -367,7 +370,8 @@ class HoeffdingTreeRegressor(HoeffdingTree, base.Regressor):
                 or hoeffding_bound < self.tie_threshold
             ):
                 should_split = True
-            if self.remove_poor_attrs:
+            # Without a positive merit, no candidate can be deemed poorer than the best one
+            if self.remove_poor_attrs and best_suggestion.merit > 0.0:
                 poor_attrs = set()
                 best_ratio = second_best_suggestion.merit / best_suggestion.merit
 
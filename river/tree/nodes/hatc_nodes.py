@@ -149,8 +149,9 @@ class AdaLeafClassifier(LeafNaiveBayesAdaptive, AdaNode):
 
         # Weight node's responses accordingly to the estimated error monitored by ADWIN
         # Useful if both the predictions of the alternate tree and the ones from the main tree
-        # are combined -> give preference to the most accurate one
-        dist = normalize_values_in_dict(dist, normalization_factor, inplace=False)
+        # are combined -> give preference to the most accurate one. dist is always a fresh
+        # dictionary at this point, hence it can be scaled in place
+        dist = normalize_values_in_dict(dist, normalization_factor)
 
         return dist
 
@@ -195,19 +196,22 @@ class AdaBranchClassifier(DTBranch, AdaNode):
             feature categories.
         """
         found_nodes = []
-        for node in self.walk(x, until_leaf=until_leaf):
-            if (
-                isinstance(node, AdaBranchClassifier)
-                and node._alternate_tree is not None
-            ):
-                if isinstance(node._alternate_tree, AdaBranchClassifier):
-                    found_nodes.append(
-                        node._alternate_tree.traverse(x, until_leaf=until_leaf)
-                    )
-                else:
-                    found_nodes.append(node._alternate_tree)
+        # The tree is descended iteratively: the alternate subtrees met along the path are put on
+        # a stack and descended afterwards
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            while isinstance(node, AdaBranchClassifier):
+                if node._alternate_tree is not None:
+                    stack.append(node._alternate_tree)
+                try:
+                    node = node.next(x)
+                except KeyError:
+                    if not until_leaf:
+                        break
+                    _, node = node.most_common_path()
+            found_nodes.append(node)
 
-        found_nodes.append(node)
         return found_nodes
 
     def iter_leaves(self):
@@ -215,14 +219,21 @@ class AdaBranchClassifier(DTBranch, AdaNode):
 
         Overrides the base implementation by also including alternate subtrees.
         """
-        for child in self.children:
-            yield from child.iter_leaves()
-
-            if (
-                isinstance(child, AdaBranchClassifier)
-                and child._alternate_tree is not None
-            ):
-                yield from child._alternate_tree.iter_leaves()
+        # Explicit stack: the alternate subtree of each child is visited right after the child
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, AdaBranchClassifier):
+                yield from node.iter_leaves()
+                continue
+
+            for child in reversed(node.children):
+                if (
+                    isinstance(child, AdaBranchClassifier)
+                    and child._alternate_tree is not None
+                ):
+                    stack.append(child._alternate_tree)
+                stack.append(child)
 
     @property
     def error_estimation(self):
@@ -152,19 +152,22 @@ class AdaBranchRegressor(DTBranch, AdaNode):
             feature categories.
         """
         found_nodes = []
-        for node in self.walk(x, until_leaf=until_leaf):
-            if (
-                isinstance(node, AdaBranchRegressor)
-                and node._alternate_tree is not None
-            ):
-                if isinstance(node._alternate_tree, AdaBranchRegressor):
-                    found_nodes.append(
-                        node._alternate_tree.traverse(x, until_leaf=until_leaf)
-                    )
-                else:
-                    found_nodes.append(node._alternate_tree)
+        # The tree is descended iteratively: the alternate subtrees met along the path are put on
+        # a stack and descended afterwards
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            while isinstance(node, AdaBranchRegressor):
+                if node._alternate_tree is not None:
+                    stack.append(node._alternate_tree)
+                try:
+                    node = node.next(x)
+                except KeyError:
+                    if not until_leaf:
+                        break
+                    _, node = node.most_common_path()
+            found_nodes.append(node)
 
-        found_nodes.append(node)
         return found_nodes
 
     def iter_leaves(self):
@@ -172,14 +175,21 @@ class AdaBranchRegressor(DTBranch, AdaNode):
 
         Overrides the base implementation by also including alternate subtrees.
         """
-        for child in self.children:
-            yield from child.iter_leaves()
-
-            if (
-                isinstance(child, AdaBranchRegressor)
-                and child._alternate_tree is not None
-            ):
-                yield from child._alternate_tree.iter_leaves()
+        # Explicit stack: the alternate subtree of each child is visited right after the child
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, AdaBranchRegressor):
+                yield from node.iter_leaves()
+                continue
+
+            for child in reversed(node.children):
+                if (
+                    isinstance(child, AdaBranchRegressor)
+                    and child._alternate_tree is not None
+                ):
+                    stack.append(child._alternate_tree)
+                stack.append(child)
 
     @property
     def error_estimation(self):
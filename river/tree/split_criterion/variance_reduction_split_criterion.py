@@ -18,20 +18,15 @@ class VarianceReductionSplitCriterion(SplitCriterion):
         self.min_samples_split = min_samples_split
 
     def merit_of_split(self, pre_split_dist, post_split_dist):
-        vr = 0.0
-        n = pre_split_dist.mean.n
+        # Every partition must hold enough samples for the split to be valid
+        for dist in post_split_dist:
+            if dist.mean.n < self.min_samples_split:
+                return 0.0
 
-        count = 0
-        for i in range(len(post_split_dist)):
-            n_i = post_split_dist[i].mean.n
-            if n_i >= self.min_samples_split:
-                count += 1
-        if count == len(post_split_dist):
-
-            vr = self.compute_var(pre_split_dist)
-            for i in range(len(post_split_dist)):
-                n_i = post_split_dist[i].mean.n
-                vr -= n_i / n * self.compute_var(post_split_dist[i])
+        n = pre_split_dist.mean.n
+        vr = self.compute_var(pre_split_dist)
+        for dist in post_split_dist:
+            vr -= dist.mean.n / n * self.compute_var(dist)
         return vr
 
     @staticmethod
@@ -243,6 +243,8 @@ class EBSTSplitter(Splitter):
 
 
 class EBSTNode:
+    __slots__ = ["att_val", "estimator", "_update_estimator", "_left", "_right"]
+
     def __init__(self, att_val, target_val, sample_weight):
         self.att_val = att_val
 
@@ -273,14 +275,15 @@ class EBSTNode:
         current = self
         antecedent = None
         is_right = False
+        update_estimator = self._update_estimator
 
         while current is not None:
             antecedent = current
             if att_val == current.att_val:
-                self._update_estimator(current, target_val, sample_weight)
+                update_estimator(current, target_val, sample_weight)
                 return
             elif att_val < current.att_val:
-                self._update_estimator(current, target_val, sample_weight)
+                update_estimator(current, target_val, sample_weight)
 
                 current = current._left
                 is_right = False
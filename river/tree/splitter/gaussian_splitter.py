@@ -24,32 +24,29 @@ class GaussianSplitter(Splitter):
 
     def __init__(self, n_splits: int = 10):
         super().__init__()
-        self._min_per_class: typing.Dict[ClfTarget, float] = {}
-        self._max_per_class: typing.Dict[ClfTarget, float] = {}
-        self._att_dist_per_class: typing.Dict[ClfTarget, Gaussian] = {}
+        # Each class maps to a [Gaussian estimator, min value, max value] record. These are
+        # always accessed together, so storing them in a single dict saves lookups.
+        self._stats_per_class: typing.Dict[ClfTarget, list] = {}
         self.n_splits = n_splits
 
     def update(self, att_val, target_val, sample_weight):
         if att_val is None:
             return
         else:
-            try:
-                val_dist = self._att_dist_per_class[target_val]
-                if att_val < self._min_per_class[target_val]:
-                    self._min_per_class[target_val] = att_val
-                if att_val > self._max_per_class[target_val]:
-                    self._max_per_class[target_val] = att_val
-            except KeyError:
-                val_dist = Gaussian()
-                self._att_dist_per_class[target_val] = val_dist
-                self._min_per_class[target_val] = att_val
-                self._max_per_class[target_val] = att_val
-
-            val_dist.update(att_val, sample_weight)
+            stats = self._stats_per_class.get(target_val)
+            if stats is None:
+                stats = [Gaussian(), att_val, att_val]
+                self._stats_per_class[target_val] = stats
+            elif att_val < stats[1]:
+                stats[1] = att_val
+            elif att_val > stats[2]:
+                stats[2] = att_val
+
+            stats[0].update(att_val, sample_weight)
 
     def cond_proba(self, att_val, target_val):
-        if target_val in self._att_dist_per_class:
-            obs = self._att_dist_per_class[target_val]
+        if target_val in self._stats_per_class:
+            obs = self._stats_per_class[target_val][0]
             return obs.pdf(att_val)
         else:
             return 0.0
@@ -58,9 +55,27 @@ class GaussianSplitter(Splitter):
         self, criterion, pre_split_dist, att_idx, binary_only
     ):
         best_suggestion = BranchFactory()
-        suggested_split_values = self._split_point_suggestions()
+
+        # The per-class statistics do not change while the candidate splits are evaluated, hence
+        # they are only gathered once. The mean and the scale of each Gaussian are also extracted
+        # so that evaluating its CDF boils down to a single call to erf.
+        class_stats = [
+            (
+                k,
+                min_k,
+                max_k,
+                estimator.n_samples,
+                estimator.mu,
+                estimator.sigma * math.sqrt(2.0),
+            )
+            for k, (estimator, min_k, max_k) in self._stats_per_class.items()
+        ]
+
+        suggested_split_values = self._split_point_suggestions(class_stats)
         for split_value in suggested_split_values:
-            post_split_dist = self._class_dists_from_binary_split(split_value)
+            post_split_dist = self._class_dists_from_binary_split(
+                split_value, class_stats
+            )
             merit = criterion.merit_of_split(pre_split_dist, post_split_dist)
             if merit > best_suggestion.merit:
                 best_suggestion = BranchFactory(
@@ -69,15 +84,15 @@ class GaussianSplitter(Splitter):
 
         return best_suggestion
 
-    def _split_point_suggestions(self):
+    def _split_point_suggestions(self, class_stats):
         suggested_split_values = []
         min_value = math.inf
         max_value = -math.inf
-        for k, estimator in self._att_dist_per_class.items():
-            if self._min_per_class[k] < min_value:
-                min_value = self._min_per_class[k]
-            if self._max_per_class[k] > max_value:
-                max_value = self._max_per_class[k]
+        for _, min_k, max_k, *_ in class_stats:
+            if min_k < min_value:
+                min_value = min_k
+            if max_k > max_value:
+                max_value = max_k
         if min_value < math.inf:
             bin_size = max_value - min_value
             bin_size /= self.n_splits + 1.0
@@ -87,15 +102,29 @@ class GaussianSplitter(Splitter):
                     suggested_split_values.append(split_value)
         return suggested_split_values
 
-    def _class_dists_from_binary_split(self, split_value):
+    @staticmethod
+    def _class_dists_from_binary_split(split_value, class_stats):
         lhs_dist = {}
         rhs_dist = {}
-        for k, estimator in self._att_dist_per_class.items():
-            if split_value < self._min_per_class[k]:
-                rhs_dist[k] = estimator.n_samples
-            elif split_value >= self._max_per_class[k]:
-                lhs_dist[k] = estimator.n_samples
+        for k, min_k, max_k, n_k, mu_k, scale_k in class_stats:
+            if split_value < min_k:
+                rhs_dist[k] = n_k
+            elif split_value >= max_k:
+                lhs_dist[k] = n_k
             else:
-                lhs_dist[k] = estimator.cdf(split_value) * estimator.n_samples
-                rhs_dist[k] = estimator.n_samples - lhs_dist[k]
+                # Same as Gaussian.cdf, but without recomputing the mean and the scale
+                try:
+                    z = (split_value - mu_k) / scale_k
+                except ZeroDivisionError:
+                    z = -math.inf
+                # erf is exactly -1 or 1 past 6 in double precision: the whole class then lies on
+                # one side of the split and there is no need to evaluate erf
+                if z >= 6.0:
+                    cdf = 1.0
+                elif z <= -6.0:
+                    cdf = 0.0
+                else:
+                    cdf = 0.5 * (1.0 + math.erf(z))
+                lhs_dist[k] = cdf * n_k
+                rhs_dist[k] = n_k - lhs_dist[k]
         return [lhs_dist, rhs_dist]
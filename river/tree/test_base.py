@@ -109,3 +109,44 @@ def test_iter_edges():
 
     for i, (parent, child) in enumerate(tree.iter_edges()):
         assert order[i] == (parent.no, child.no)
+
+
+class FeatureBranch(BinaryBranch):
+    def next(self, x):
+        return super().next(x[self.feature])
+
+    def most_common_path(self):
+        return 1, self.children[1]
+
+
+def test_walk():
+
+    tree = BinaryBranch(
+        BinaryBranch(Leaf(no=3), Leaf(no=4), threshold=1, no=2),
+        Leaf(no=5),
+        threshold=2,
+        no=1,
+    )
+
+    assert [node.no for node in tree.walk(0)] == [1, 2, 3]
+    assert [node.no for node in tree.walk(1)] == [1, 2, 4]
+    assert [node.no for node in tree.walk(2)] == [1, 5]
+    assert tree.traverse(1).no == 4
+
+
+def test_walk_missing_feature():
+
+    tree = FeatureBranch(
+        Leaf(no=2),
+        FeatureBranch(Leaf(no=4), Leaf(no=5), threshold=0, feature="b", no=3),
+        threshold=0,
+        feature="a",
+        no=1,
+    )
+
+    # Each node of the most common path is visited once
+    assert [node.no for node in tree.walk({"b": 1})] == [1, 3, 5]
+    assert [node.no for node in tree.walk({"b": 1}, until_leaf=False)] == [1]
+    assert [node.no for node in tree.walk({"a": 1}, until_leaf=False)] == [1, 3]
+    assert tree.traverse({"a": 1}).no == 5
+    assert tree.traverse({"a": 1}, until_leaf=False).no == 3
@@ -1,8 +1,10 @@
+import copy
 import random
 
 import pytest
 
 from river import datasets, synth, tree
+from river.tree.nodes.branch import DTBranch
 
 
 def get_classification_data():
@@ -79,6 +81,80 @@ def test_memory_usage_reg(dataset, model):
     assert model._raw_memory_usage / (2 ** 20) < 0.5
 
 
+@pytest.mark.parametrize(
+    "dataset, model",
+    [
+        (
+            get_regression_data(),
+            tree.HoeffdingTreeRegressor(
+                leaf_prediction="mean", memory_estimate_period=10
+            ),
+        ),
+        (
+            get_regression_data(),
+            tree.HoeffdingAdaptiveTreeRegressor(
+                leaf_prediction="mean", memory_estimate_period=10, seed=42
+            ),
+        ),
+        (
+            get_classification_data(),
+            tree.HoeffdingTreeClassifier(memory_estimate_period=10),
+        ),
+        (
+            get_classification_data(),
+            tree.HoeffdingAdaptiveTreeClassifier(memory_estimate_period=10, seed=42),
+        ),
+        (
+            get_classification_data(),
+            tree.ExtremelyFastDecisionTreeClassifier(memory_estimate_period=10),
+        ),
+    ],
+)
+def test_memory_estimate_period_fractional_weights(dataset, model):
+    n_checks = 0
+    estimate_model_size = model._estimate_model_size
+
+    def count_checks():
+        nonlocal n_checks
+        n_checks += 1
+        estimate_model_size()
+
+    model._estimate_model_size = count_checks
+    for x, y in dataset:
+        model.learn_one(x, y, sample_weight=0.3)
+
+    # 500 samples weighing 0.3 each amount to 15 memory estimation periods
+    assert 14 <= n_checks <= 15
+
+
+def test_constant_target_is_not_split():
+    model = tree.HoeffdingTreeRegressor(
+        grace_period=50, leaf_prediction="mean", remove_poor_attrs=True
+    )
+
+    for x, _ in get_regression_data():
+        model.learn_one(x, 1.0)
+
+    assert model.n_nodes == 1
+    assert model.predict_one(x) == 1.0
+
+
+def test_remove_poor_attrs_without_valid_candidates():
+    # No candidate split gathers min_samples_split samples in each partition, hence they all
+    # have a null merit
+    model = tree.HoeffdingTreeRegressor(
+        grace_period=50,
+        leaf_prediction="mean",
+        remove_poor_attrs=True,
+        min_samples_split=10000,
+    )
+
+    for x, y in synth.Friedman(seed=1).take(500):
+        model.learn_one(x, y)
+
+    assert model.n_nodes == 1
+
+
 def test_memory_usage_multilabel():
     dataset = datasets.Music().take(500)
 
@@ -179,3 +255,115 @@ def test_drift_adaptation_hatr():
         model.learn_one(x, y_)
 
     assert model._n_alternate_trees > 0
+
+
+@pytest.mark.parametrize(
+    "dataset, model",
+    [
+        (
+            synth.ConceptDriftStream(
+                stream=synth.Sine(seed=8, classification_function=0),
+                drift_stream=synth.Sine(seed=8, classification_function=2),
+                seed=8,
+                position=1000,
+                width=50,
+            ).take(3000),
+            tree.HoeffdingAdaptiveTreeClassifier(
+                leaf_prediction="mc",
+                grace_period=10,
+                adwin_confidence=0.1,
+                split_confidence=0.1,
+                drift_window_threshold=2,
+                seed=42,
+            ),
+        ),
+        (
+            (
+                (x, y if i < 500 else 3 * y)
+                for i, (x, y) in enumerate(synth.Friedman(seed=4).take(1500))
+            ),
+            tree.HoeffdingAdaptiveTreeRegressor(
+                leaf_prediction="mean",
+                grace_period=20,
+                split_confidence=0.1,
+                adwin_confidence=0.1,
+                drift_window_threshold=10,
+                seed=4,
+            ),
+        ),
+    ],
+)
+def test_hat_has_alternate_trees_flag(dataset, model):
+    n_steps_with_alternates = 0
+    for x, y in dataset:
+        model.learn_one(x, y)
+        has_alternates = isinstance(model._root, DTBranch) and any(
+            branch._alternate_tree is not None for branch in model._root.iter_branches()
+        )
+        assert model._has_alternate_trees == has_alternates
+        n_steps_with_alternates += has_alternates
+
+    assert n_steps_with_alternates > 0
+
+
+def test_hatc_traverse_alternate_subtree():
+    dataset = synth.SEA(seed=7, variant=0).take(500)
+
+    model = tree.HoeffdingAdaptiveTreeClassifier(
+        grace_period=50, split_confidence=0.1, seed=7
+    )
+    for x, y in dataset:
+        model.learn_one(x, y)
+
+    assert model.height > 1
+
+    # Use a copy of the whole tree as the alternate subtree of the root
+    alternate_tree = copy.deepcopy(model._root)
+    model._root._alternate_tree = alternate_tree
+
+    found_nodes = model._root.traverse(x, until_leaf=True)
+
+    *_, leaf = model._root.walk(x)
+    *_, alternate_leaf = alternate_tree.walk(x)
+
+    assert len(found_nodes) == 2
+    assert any(node is leaf for node in found_nodes)
+    assert any(node is alternate_leaf for node in found_nodes)
+    assert sum(model.predict_proba_one(x).values()) == pytest.approx(1.0)
+
+
+def test_hatr_traverse_alternate_subtree():
+    dataset = synth.Friedman(seed=1).take(500)
+
+    model = tree.HoeffdingAdaptiveTreeRegressor(
+        grace_period=50, leaf_prediction="mean", seed=1
+    )
+    for x, y in dataset:
+        model.learn_one(x, y)
+
+    assert model.height > 1
+
+    # Use a copy of the whole tree as the alternate subtree of the root's left child
+    child = model._root.children[0]
+    assert child.n_leaves > 1
+    alternate_tree = copy.deepcopy(model._root)
+    child._alternate_tree = alternate_tree
+
+    # The alternate subtree leaves come right after the leaves of the child
+    leaves = [id(leaf) for leaf in model._root.iter_leaves()]
+    expected = [id(leaf) for leaf in child.iter_leaves()]
+    expected += [id(leaf) for leaf in alternate_tree.iter_leaves()]
+    expected += [id(leaf) for leaf in model._root.children[1].iter_leaves()]
+    assert leaves == expected
+
+    # Route the instance towards the left child
+    x = {**x, model._root.feature: model._root.threshold}
+    found_nodes = model._root.traverse(x, until_leaf=True)
+
+    *_, leaf = model._root.walk(x)
+    *_, alternate_leaf = alternate_tree.walk(x)
+
+    assert len(found_nodes) == 2
+    assert any(node is leaf for node in found_nodes)
+    assert any(node is alternate_leaf for node in found_nodes)
+    assert isinstance(model.predict_one(x), float)
@@ -62,7 +62,7 @@ def check_learn_one(model, dataset):
 
     for x, y in dataset:
 
-        xx, yy = copy.deepcopy(x), copy.deepcopy(y)
+        xx, yy = copy.copy(x), copy.copy(y)
 
         model = model.learn_one(x, y)
 
@@ -82,7 +82,7 @@ def check_predict_proba_one(classifier, dataset):
 
     for x, y in dataset:
 
-        xx, yy = copy.deepcopy(x), copy.deepcopy(y)
+        xx, yy = copy.copy(x), copy.copy(y)
 
         classifier = classifier.learn_one(x, y)
         y_pred = classifier.predict_proba_one(x)
@@ -367,4 +367,4 @@ def check_estimator(model):
     for check in yield_checks(model):
         if check.__name__ in model._unit_test_skips():
             continue
-        check(copy.deepcopy(model))
+        check(model.clone())
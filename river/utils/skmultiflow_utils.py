@@ -173,6 +173,18 @@ def calculate_object_size(obj, unit="byte") -> int:
                 to_visit.append(k)
         elif hasattr(obj, "__dict__"):
             to_visit.append(obj.__dict__)
+        elif hasattr(obj, "__slots__"):
+            # Slots are declared per class, hence the inherited ones must be collected too
+            for cls in type(obj).__mro__:
+                slots = cls.__dict__.get("__slots__", ())
+                if isinstance(slots, str):
+                    slots = (slots,)
+                for attr in slots:
+                    # Private slot names are mangled with the name of their class
+                    if attr.startswith("__") and not attr.endswith("__"):
+                        attr = f"_{cls.__name__.lstrip('_')}{attr}"
+                    if hasattr(obj, attr):
+                        to_visit.append(getattr(obj, attr))
         elif hasattr(obj, "__iter__") and not isinstance(obj, (str, bytes, bytearray)):
             for i in obj:
                 to_visit.append(i)